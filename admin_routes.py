@@ -32,7 +32,8 @@ def register_admin(app, deps: dict):
       - models (dict or object with Title, Reservation, ActiveTitle, RequestLog, Setting, ServerConfig)
       - db_helpers (dict) with:
           compute_slots, requestable_title_names, schedule_lookup
-      - airtable_upsert (optional callable)
+      - airtable_append (optional callable; create-only)
+      - invalidate_server_config_cache (optional callable) -> None
     """
     # --- deps ---
     ADMIN_PIN: str = deps["ADMIN_PIN"]
@@ -40,6 +41,7 @@ def register_admin(app, deps: dict):
     set_shift_hours: Callable[[int], None] = deps.get("db_set_shift_hours") or deps.get("set_shift_hours")
     send_webhook_notification: Callable[..., None] = deps["send_webhook_notification"]
     SERVER_CONFIGS: Dict[int, Dict[str, Any]] = deps["SERVER_CONFIGS"]  # shared mutable cache
+    invalidate_server_config_cache: Callable[[], None] = deps.get("invalidate_server_config_cache") or (lambda: None)
     db = deps["db"]
 
     M = deps["models"]
@@ -47,7 +49,7 @@ def register_admin(app, deps: dict):
         M = SimpleNamespace(**M)
 
     H: Dict[str, Callable[..., Any]] = deps.get("db_helpers", {}) or {}
-    airtable_upsert: Optional[Callable[..., None]] = deps.get("airtable_upsert")
+    airtable_append: Optional[Callable[..., None]] = deps.get("airtable_append")
 
     admin_bp = Blueprint("admin", __name__, template_folder="templates/admin", url_prefix="/admin")
 
@@ -69,6 +71,7 @@ def register_admin(app, deps: dict):
         try:
             rows = M.ServerConfig.query.all()
         except Exception:
+            invalidate_server_config_cache()
             return
         for r in rows:
             try:
@@ -82,6 +85,7 @@ def register_admin(app, deps: dict):
                 except Exception:
                     rid = None
             SERVER_CONFIGS[gid] = {"webhook": r.webhook_url, "guardian_role_id": rid}
+        invalidate_server_config_cache()  # after the reload, so nothing caches a half-built view
 
     # ========== Auth ==========
     @admin_bp.route("/login", methods=["GET", "POST"])
@@ -416,9 +420,9 @@ def register_admin(app, deps: dict):
 
             db.session.commit()
 
-            if airtable_upsert:
+            if airtable_append:
                 try:
-                    airtable_upsert("assignment", {
+                    airtable_append("assignment", {
                         "Title": title,
                         "IGN": ign,
                         "Coordinates": "-",
@@ -474,9 +478,9 @@ def register_admin(app, deps: dict):
 
             db.session.commit()
 
-            if airtable_upsert:
+            if airtable_append:
                 try:
-                    airtable_upsert("assignment", {
+                    airtable_append("assignment", {
                         "Title": title,
                         "IGN": new_ign,
                         "Coordinates": "-",
@@ -579,9 +583,9 @@ def register_admin(app, deps: dict):
             flash("Reservation saved, but live assignment failed to update.", "error")
             return redirect(url_for("admin.ops"))
 
-        if airtable_upsert:
+        if airtable_append:
             try:
-                airtable_upsert("assignment", {
+                airtable_append("assignment", {
                     "Title": title,
                     "IGN": ign,
                     "Coordinates": "-",
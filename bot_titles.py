@@ -3,8 +3,10 @@
 
 import re
 import os
+import time
 import datetime as dt
 from typing import Optional, List
+from zoneinfo import ZoneInfo
 
 import aiohttp
 import discord
@@ -38,6 +40,17 @@ minutes_allowed = {0}  # for strict HH:00; set to {0, 30} if you ever allow half
 
 COORDS_RE = re.compile(r"^\s*\d+\s*:\s*\d+\s*$")
 
+# /titles timeguide rows, built once: (label, IANA zone)
+TIMEGUIDE_ZONES = (
+    ("Los Angeles (PT)", "America/Los_Angeles"),
+    ("US Mountain", "America/Denver"),
+    ("US Central / Mexico City", "America/Chicago"),
+    ("New York (ET)", "America/New_York"),
+    ("United Kingdom", "Europe/London"),
+    ("Germany (CET/CEST)", "Europe/Berlin"),
+    ("Argentina", "America/Argentina/Buenos_Aires"),
+)
+
 
 def _now_utc():
     return dt.datetime.now(dt.timezone.utc)
@@ -87,13 +100,41 @@ async def _get_requestable(session: aiohttp.ClientSession) -> List[str]:
     return REQUESTABLE_TITLES_FALLBACK
 
 
+# Autocomplete fires per keystroke; keep the requestable list in memory between calls
+REQUESTABLE_CACHE_TTL = 60  # seconds
+_REQUESTABLE_CACHE: tuple = ()
+_REQUESTABLE_LOWER: tuple = ()  # (lowercased, original) pairs, rebuilt with the cache
+_REQUESTABLE_CACHE_AT = 0.0
+
+
+async def _refresh_requestable_cache() -> tuple:
+    global _REQUESTABLE_CACHE, _REQUESTABLE_LOWER, _REQUESTABLE_CACHE_AT
+    async with aiohttp.ClientSession() as session:
+        titles = tuple(await _get_requestable(session))
+    if titles != _REQUESTABLE_CACHE:
+        _REQUESTABLE_CACHE = titles
+        _REQUESTABLE_LOWER = tuple((t.lower(), t) for t in titles)
+    _REQUESTABLE_CACHE_AT = time.monotonic()
+    return _REQUESTABLE_CACHE
+
+
+async def _cached_requestable() -> tuple:
+    if _REQUESTABLE_CACHE and time.monotonic() - _REQUESTABLE_CACHE_AT < REQUESTABLE_CACHE_TTL:
+        return _REQUESTABLE_CACHE
+    return await _refresh_requestable_cache()
+
+
 # ---------- FIXED: module-level autocomplete (no 'self' required) ----------
 async def _title_autocomplete(interaction: discord.Interaction, current: str):
-    async with aiohttp.ClientSession() as session:
-        all_titles = await _get_requestable(session)
+    await _cached_requestable()
     current_lower = (current or "").lower()
-    filtered = [t for t in all_titles if current_lower in t.lower()]
-    return [app_commands.Choice(name=t, value=t) for t in filtered[:25]]
+    choices = []
+    for lower, t in _REQUESTABLE_LOWER:
+        if current_lower in lower:
+            choices.append(app_commands.Choice(name=t, value=t))
+            if len(choices) == 25:  # Discord's autocomplete limit
+                break
+    return choices
 
 
 class TitlesGroup(app_commands.Group):
@@ -133,8 +174,8 @@ class TitlesGroup(app_commands.Group):
         coords_raw = (coords or "").strip()
         coords_norm = "-" if not coords_raw or coords_raw == "-" else coords_raw
 
-        async with aiohttp.ClientSession() as session:
-            requestable = await _get_requestable(session)
+        # Pre-check only (the Flask form re-validates), so the TTL cache is good enough here
+        requestable = await _cached_requestable()
 
         errors = []
         if title not in requestable:
@@ -224,7 +265,6 @@ class TitlesGroup(app_commands.Group):
 
         def tz_line(label: str, tzname: str) -> str:
             try:
-                from zoneinfo import ZoneInfo
                 local = base.astimezone(ZoneInfo(tzname))
                 badge = ""
                 if local.date() > base.date():
@@ -235,15 +275,7 @@ class TitlesGroup(app_commands.Group):
             except Exception:
                 return f"• **{label}** — (unavailable)"
 
-        lines = [
-            tz_line("Los Angeles (PT)", "America/Los_Angeles"),
-            tz_line("US Mountain", "America/Denver"),
-            tz_line("US Central / Mexico City", "America/Chicago"),
-            tz_line("New York (ET)", "America/New_York"),
-            tz_line("United Kingdom", "Europe/London"),
-            tz_line("Germany (CET/CEST)", "Europe/Berlin"),
-            tz_line("Argentina", "America/Argentina/Buenos_Aires"),
-        ]
+        lines = [tz_line(label, tzname) for label, tzname in TIMEGUIDE_ZONES]
 
         await interaction.followup.send(
             f"**{base.strftime('%Y-%m-%d %H:%M')} UTC** converts to:\n" + "\n".join(lines),
@@ -316,6 +348,7 @@ class MyBot(commands.Bot):
         self.tree.add_command(grp)
         # Nest admin subgroup
         grp.add_command(grp.admin)
+        await _refresh_requestable_cache()
         await self.tree.sync()
 
 
@@ -12,27 +12,39 @@ import re
 import atexit
 import secrets
 import time
-from threading import Thread, RLock
+import queue
+import sqlite3
+from threading import Thread, RLock, Lock, Event
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional
 from urllib.parse import urlparse, parse_qsl, urlencode, urlunparse
-from contextlib import contextmanager
+from contextlib import contextmanager, ExitStack
+from dataclasses import dataclass
+from collections import defaultdict
+from types import MappingProxyType
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, Future
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import discord
 from discord.ext import commands, tasks
 from discord.errors import LoginFailure
 from discord import app_commands
 
-from flask import Flask
+from flask import Flask, has_app_context
 from waitress import serve
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from dotenv import load_dotenv
-from sqlalchemy import event, text, inspect
+from sqlalchemy import event, text, inspect, select, update
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from models import db, Title, Reservation, ActiveTitle, RequestLog, Setting, ServerConfig
 from db_utils import (
@@ -53,6 +65,27 @@ except Exception:
 
 from admin_routes import register_admin
 
+# ===== orjson (optional; faster JSON, falls back to stdlib) =====
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+def _json_bytes(obj) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, preferring orjson; unknown types fall back to str()."""
+    if orjson is not None:
+        # NON_STR_KEYS: stdlib json coerces int/float keys to strings; orjson would raise instead
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8")
+
+# ===== uvloop (optional; faster event loop for the Discord thread) =====
+try:
+    import uvloop
+    # Policy-level, so the asyncio.run() inside bot.run() on the bot thread picks it up.
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except Exception:
+    uvloop = None
+
 # ===== Airtable (optional; safe import) =====
 try:
     from pyairtable import Api
@@ -60,18 +93,71 @@ except Exception:
     Api = None
     ApiError = Exception
 
-def airtable_upsert(kind, data):
-    """Stub for Airtable upsert; does nothing if not configured."""
-    if not airtable_table:
-        logger.debug("airtable_upsert skipped (%s): integration not configured", kind)
+AIRTABLE_BATCH_SIZE = 10         # Airtable accepts at most 10 records per create request
+AIRTABLE_FLUSH_SECONDS = 1.0
+AIRTABLE_QUEUE_MAX = 1000        # per kind
+_AIRTABLE_QUEUE: defaultdict[str, list[dict]] = defaultdict(list)
+_AIRTABLE_LOCK = Lock()
+_AIRTABLE_WAKE = Event()
+_airtable_flusher: Optional[Thread] = None
+
+def _airtable_fields(data: dict) -> dict:
+    """Airtable wants JSON-safe values; render datetimes as ISO strings and drop empties."""
+    return {k: (v.isoformat() if isinstance(v, datetime) else v) for k, v in data.items() if v is not None}
+
+def _airtable_append_batch(kind: str, records: list[dict]) -> None:
+    """One batch_create POST for up to AIRTABLE_BATCH_SIZE records of the same kind; never raises."""
+    try:
+        airtable_table.batch_create(records, typecast=True)
+    except Exception as e:
+        logger.error("Airtable batch_create failed (%s, %d record(s) dropped): %s", kind, len(records), e)
+
+def _flush_airtable() -> None:
+    """Drain every kind's queue in AIRTABLE_BATCH_SIZE chunks."""
+    while True:
+        with _AIRTABLE_LOCK:
+            kind = next((k for k, q in _AIRTABLE_QUEUE.items() if q), None)
+            if kind is None:
+                return
+            q = _AIRTABLE_QUEUE[kind]
+            batch = q[:AIRTABLE_BATCH_SIZE]
+            del q[:AIRTABLE_BATCH_SIZE]
+        _airtable_append_batch(kind, batch)
+
+def _airtable_flush_loop() -> None:
+    while True:
+        _AIRTABLE_WAKE.wait(AIRTABLE_FLUSH_SECONDS)
+        _AIRTABLE_WAKE.clear()
+        _flush_airtable()
+
+def airtable_append(kind, data):
+    """Queue a new Airtable row for the background batch writer, tagged with its kind when
+    AIRTABLE_KIND_FIELD names a column. Create-only, not an upsert; does nothing unless
+    configured and AIRTABLE_WRITES is on."""
+    global _airtable_flusher
+    if not (airtable_table and AIRTABLE_WRITES):
+        logger.debug("airtable_append skipped (%s): integration not enabled", kind)
         return
-    # Implement actual upsert logic if/when needed.
+    with _AIRTABLE_LOCK:
+        q = _AIRTABLE_QUEUE[kind]
+        if len(q) >= AIRTABLE_QUEUE_MAX:
+            logger.warning("Airtable queue full (%s); dropping oldest record", kind)
+            q.pop(0)
+        q.append(_airtable_fields({AIRTABLE_KIND_FIELD: kind, **data} if AIRTABLE_KIND_FIELD else data))
+        full = len(q) >= AIRTABLE_BATCH_SIZE
+        if _airtable_flusher is None:
+            _airtable_flusher = Thread(target=_airtable_flush_loop, name="airtable-flush", daemon=True)
+            _airtable_flusher.start()
+            atexit.register(_flush_airtable)
+    if full:
+        _AIRTABLE_WAKE.set()
 
 load_dotenv()
 
 # -------------------- Constants & Globals --------------------
 UTC = timezone.utc
 SHIFT_HOURS = 12  # default shift window
+BACKFILL_CHUNK = 500  # rows per UPDATE/commit in startup backfills
 
 BASE_DIR = os.path.dirname(__file__)
 DATA_DIR = os.path.join(BASE_DIR, "data")
@@ -82,8 +168,31 @@ os.makedirs(STATIC_DIR, exist_ok=True)
 STATE_FILE = os.path.join(DATA_DIR, "titles_state.json")
 CSV_FILE   = os.path.join(DATA_DIR, "requests.csv")
 
-state: dict = {}
-state_lock = RLock()
+def _empty_state() -> dict:
+    return {'titles': {}, 'config': {}, 'schedules': {}, 'activated_slots': {}, 'sent_reminders': []}
+
+# Top-level keys always exist (here, initialize_state, load_state), so hot paths index directly
+state: dict = _empty_state()
+state_lock = RLock()  # whole document: load/save, 'config', 'sent_reminders'
+
+# Per-title shards for state['schedules'|'titles'|'activated_slots'][title]. Lock order is
+# state_lock -> shards (ascending). save_state() only flags the writer thread, which
+# snapshots under _all_state_locks() and writes the file after releasing them, so it's safe
+# to call under any of these locks.
+TITLE_LOCK_SHARDS = 16
+_title_locks = tuple(RLock() for _ in range(TITLE_LOCK_SHARDS))
+
+def _lk(title_name: str) -> RLock:
+    return _title_locks[hash(title_name) % TITLE_LOCK_SHARDS]
+
+@contextmanager
+def _all_state_locks():
+    """Exclusive hold on the whole state dict (needed to serialize or replace it)."""
+    with ExitStack() as stack:
+        stack.enter_context(state_lock)
+        for lk in _title_locks:
+            stack.enter_context(lk)
+        yield
 
 # Global scheduler handle
 scheduler: Optional[BackgroundScheduler] = None
@@ -112,6 +221,10 @@ DISCORD_TOKEN = (os.getenv("DISCORD_TOKEN") or "").strip()
 AIRTABLE_API_KEY = os.getenv("AIRTABLE_API_KEY")
 AIRTABLE_BASE_ID = os.getenv("AIRTABLE_BASE_ID")
 AIRTABLE_TABLE   = os.getenv("AIRTABLE_TABLE", "TitleLog")
+# Writes are opt-in: rows are append-only (no upsert key), so a re-submit adds another row
+AIRTABLE_WRITES  = os.getenv("AIRTABLE_WRITES", "0").strip().lower() in ("1", "true", "yes", "on")
+# Optional column that records which kind of event a row is; the table must have it (422 otherwise)
+AIRTABLE_KIND_FIELD = (os.getenv("AIRTABLE_KIND_FIELD") or "").strip() or None
 airtable_table = None
 if Api and AIRTABLE_API_KEY and AIRTABLE_BASE_ID:
     try:
@@ -119,12 +232,14 @@ if Api and AIRTABLE_API_KEY and AIRTABLE_BASE_ID:
         airtable_table = api.table(AIRTABLE_BASE_ID, AIRTABLE_TABLE)
     except Exception as e:
         logger.warning("Airtable not configured: %s", e)
+if airtable_table and not AIRTABLE_WRITES:
+    logger.warning("Airtable credentials are set but AIRTABLE_WRITES is off; no rows will be written.")
 
 # Multiserver cache (guild_id -> {"webhook": str, "guardian_role_id": Optional[int]})
 SERVER_CONFIGS: dict[int, dict] = {}
 
 # -------------------- Titles Catalog --------------------
-TITLES_CATALOG = {
+TITLES_CATALOG = MappingProxyType({
     "Guardian of Harmony": {
         "effects": "All benders' ATK +5%, All benders' DEF +5%, All Benders' recruiting speed +15%",
         "image": "/static/icons/guardian_harmony.png"
@@ -149,26 +264,29 @@ TITLES_CATALOG = {
     "General":   {"effects": "All benders' ATK +5%",    "image": "/static/icons/general.png"},
     "Governor":  {"effects": "All Benders' recruiting speed +10%", "image": "/static/icons/governor.png"},
     "Prefect":   {"effects": "Research Speed +10%",     "image": "/static/icons/prefect.png"}
-}
-ORDERED_TITLES = list(TITLES_CATALOG.keys())
-REQUESTABLE = {t for t in ORDERED_TITLES if t != "Guardian of Harmony"}
+})
+ORDERED_TITLES: tuple[str, ...] = tuple(TITLES_CATALOG)
+REQUESTABLE = frozenset(t for t in ORDERED_TITLES if t != "Guardian of Harmony")
 ICON_FILES = {name: data.get('image') for name, data in TITLES_CATALOG.items()}
 
 # -------------------- Time + helpers --------------------
 def now_utc() -> datetime:
     return datetime.now(UTC)
 
+# Keys are slot/claim strings (bounded by slot count) and datetimes are immutable, so memoize
+@lru_cache(maxsize=4096)
 def parse_iso_utc(s: str | None) -> Optional[datetime]:
     """Parse ISO and return UTC-aware dt or None; tolerant of naive inputs."""
     if not s:
         return None
     try:
-        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=UTC)
-        return dt.astimezone(UTC)
-    except Exception:
+        # C-level on 3.11+ (accepts 'Z' too); ~10x faster than a regex + int() split
+        dt = datetime.fromisoformat(s)
+    except (TypeError, ValueError):
         return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=UTC)
+    return dt if dt.tzinfo is UTC else dt.astimezone(UTC)
 
 def normalize_slot_dt(dt: datetime) -> datetime:
     """Normalize a slot start to a zeroed-seconds UTC timestamp."""
@@ -179,7 +297,8 @@ def normalize_slot_dt(dt: datetime) -> datetime:
 
 def iso_slot_key_naive(dt: datetime) -> str:
     """Legacy key used by JSON state."""
-    return normalize_slot_dt(dt).strftime("%Y-%m-%dT%H:%M:%S")
+    dt = normalize_slot_dt(dt)
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}:00"
 
 # -------------------- DB URL normalization --------------------
 def _normalize_db_uri(raw: str | None) -> str:
@@ -198,71 +317,217 @@ def _normalize_db_uri(raw: str | None) -> str:
     return urlunparse((parsed.scheme, parsed.netloc, parsed.path, parsed.params, new_query, parsed.fragment))
 
 # -------------------- State I/O --------------------
+@dataclass(slots=True, frozen=True)
+class TitleState:
+    """Live holder of one title in the JSON mirror; datetimes are UTC-aware.
+
+    Frozen: writers swap in a new instance, so readers can take one without a lock.
+    """
+    holder_name: Optional[str] = None
+    claim_dt: Optional[datetime] = None
+    expiry_dt: Optional[datetime] = None
+
+    def to_json(self) -> dict:
+        """On-disk shape (unchanged from the dict-based state file)."""
+        return {
+            'holder': ({'name': self.holder_name, 'coords': '-', 'discord_id': 0} if self.holder_name else None),
+            'claim_date': (self.claim_dt.isoformat() if self.claim_dt else None),
+            'expiry_date': (self.expiry_dt.isoformat() if self.expiry_dt else None),
+        }
+
+    @classmethod
+    def from_json(cls, data: dict | None) -> "TitleState":
+        data = data or {}
+        holder = data.get('holder')
+        name = holder.get('name') if isinstance(holder, dict) else (holder or None)
+        return cls(name, parse_iso_utc(data.get('claim_date')), parse_iso_utc(data.get('expiry_date')))
+
+# Set mirror of state['sent_reminders'] (the list is what's persisted); kept in step under state_lock
+_sent_reminder_keys: set[str] = set()
+
+def _publish_state_unlocked(new: dict) -> None:
+    """Swap fully built top-level values into `state`. Web routes hold a reference to this
+    dict, so it's updated in place; each key is one assignment, which lock-free readers see
+    as either the old value or the new one, never an empty or half-converted document."""
+    state.update(new)
+    for key in [k for k in state if k not in new]:
+        del state[key]
+
 def initialize_state():
-    with state_lock:
-        state.clear()
-        state.update({
-            'titles': {}, 'config': {}, 'schedules': {},
-            'activated_slots': {}, 'sent_reminders': []
-        })
-    _save_state_unlocked()
+    with _all_state_locks():
+        _publish_state_unlocked(_empty_state())
+        _save_state_unlocked()
 
 def load_state():
-    global state
-    with state_lock:
+    with _all_state_locks():
+        # on_ready re-runs this on reconnect. A pending write may be only flagged, or already
+        # snapshotted by flush_state but not yet on disk (it writes outside these locks); either
+        # way the file is older than memory, so persist memory before reading it back.
+        if _STATE_DIRTY.is_set() or _state_written_seq < _state_seq:
+            _STATE_DIRTY.clear()
+            _save_state_unlocked()
+        loaded = None
         if os.path.exists(STATE_FILE):
             try:
-                with open(STATE_FILE, 'r', encoding='utf-8') as f:
-                    state = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
+                with _state_file_lock:  # no half-finished replace underneath the read
+                    with open(STATE_FILE, 'rb') as f:
+                        raw = f.read()
+                loaded = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            except (ValueError, IOError) as e:  # json.JSONDecodeError and orjson.JSONDecodeError are ValueErrors
                 logger.error("Error loading state file: %s. Re-initializing.", e)
-                initialize_state()
-        else:
-            initialize_state()
-        # Backward-compat defaults
-        state.setdefault('titles', {})
-        state.setdefault('config', {})
-        state.setdefault('schedules', {})
-        state.setdefault('activated_slots', {})
-        state.setdefault('sent_reminders', [])
+        # Build the complete document (backward-compat defaults, TitleState entries) first
+        new = _empty_state()
+        new.update(loaded or {})
+        titles = {name: TitleState.from_json(t) for name, t in new['titles'].items()}
+        for name in ORDERED_TITLES:
+            titles.setdefault(name, TitleState())
+        new['titles'] = titles
+        _publish_state_unlocked(new)
+        if loaded is None:
+            _save_state_unlocked()
+        _sent_reminder_keys.clear()
+        _sent_reminder_keys.update(state['sent_reminders'])
+
+_state_file_lock = Lock()
+_state_seq = 0          # bumped per snapshot (under the state locks)
+_state_written_seq = 0  # newest snapshot on disk (under _state_file_lock)
+
+def _snapshot_state_unlocked() -> tuple[int, bytes]:
+    """Serialize state to bytes; caller holds the state locks. The bytes are the snapshot."""
+    global _state_seq
+    on_disk = dict(state)
+    on_disk['titles'] = {k: v.to_json() for k, v in state.get('titles', {}).items()}
+    _state_seq += 1
+    return _state_seq, _json_bytes(on_disk)  # compact: machine-read only, smaller and faster
+
+def _write_state_file(seq: int, data: bytes):
+    """Atomically replace the state file; needs no state lock, and never lets an older snapshot win."""
+    global _state_written_seq
+    tmp = STATE_FILE + ".tmp"
+    with _state_file_lock:
+        if seq <= _state_written_seq:
+            return
+        try:
+            with open(tmp, 'wb') as f:
+                f.write(data)
+            os.replace(tmp, STATE_FILE)
+            _state_written_seq = seq
+        except IOError as e:
+            logger.error("Error saving state file: %s", e)
 
 def _save_state_unlocked():
-    tmp = STATE_FILE + ".tmp"
-    try:
-        with open(tmp, 'w', encoding='utf-8') as f:
-            json.dump(state, f, indent=2, ensure_ascii=False, default=str)
-        os.replace(tmp, STATE_FILE)
-    except IOError as e:
-        logger.error("Error saving state file: %s", e)
+    _write_state_file(*_snapshot_state_unlocked())
+
+# save_state() only marks the state dirty; one writer thread coalesces bursts into a single dump
+STATE_SAVE_DEBOUNCE = 2.0  # seconds
+_STATE_DIRTY = Event()
+_state_writer: Optional[Thread] = None
+_state_writer_lock = Lock()
+
+def flush_state():
+    """Write the state file now."""
+    _STATE_DIRTY.clear()  # mutations from here on re-mark it and get their own write
+    with _all_state_locks():
+        snap = _snapshot_state_unlocked()
+    _write_state_file(*snap)  # disk I/O outside the locks; readers/writers of state proceed
+
+def _flush_state_if_dirty():
+    if _STATE_DIRTY.is_set():
+        flush_state()
+
+def _state_writer_loop():
+    while True:
+        _STATE_DIRTY.wait()
+        time.sleep(STATE_SAVE_DEBOUNCE)
+        flush_state()
 
 def save_state():
-    with state_lock:
-        _save_state_unlocked()
+    """Schedule a debounced write of the state file; never blocks on disk."""
+    global _state_writer
+    _STATE_DIRTY.set()
+    if _state_writer is None:
+        with _state_writer_lock:
+            if _state_writer is None:
+                _state_writer = Thread(target=_state_writer_loop, name="state-writer", daemon=True)
+                _state_writer.start()
+                atexit.register(_flush_state_if_dirty)
 
 async def save_state_async():
-    await asyncio.to_thread(save_state)
+    save_state()
+
+CSV_FIELDS = ['timestamp', 'title_name', 'in_game_name', 'coordinates', 'discord_user']
+
+# requests.csv has a single writer thread; log_to_csv only enqueues. The file stays open and is
+# flushed every CSV_FLUSH_ROWS rows or after CSV_FLUSH_SECONDS idle, so /log lags by <1s.
+CSV_FLUSH_ROWS = 50
+CSV_FLUSH_SECONDS = 0.5
+_CSV_STOP = object()
+_csv_q: "queue.Queue" = queue.Queue(maxsize=10000)
+_csv_thread: Optional[Thread] = None
+_csv_thread_lock = Lock()
+
+def _csv_writer_loop() -> None:
+    fh = writer = None
+    pending = 0
+    while True:
+        try:
+            row = _csv_q.get(timeout=CSV_FLUSH_SECONDS if pending else None)
+        except queue.Empty:
+            row = None
+        if row is _CSV_STOP:
+            if fh is not None:
+                fh.close()
+            return
+        if row is not None:
+            try:
+                if writer is None:
+                    new_file = not os.path.isfile(CSV_FILE) or os.path.getsize(CSV_FILE) == 0
+                    fh = open(CSV_FILE, 'a', newline='', encoding='utf-8')
+                    writer = csv.DictWriter(fh, fieldnames=CSV_FIELDS)
+                    if new_file:
+                        writer.writeheader()
+                writer.writerow(row)
+                pending += 1
+            except IOError as e:
+                logger.error("Error writing to CSV: %s", e)
+                if fh is not None:
+                    try:
+                        fh.close()
+                    except IOError:
+                        pass
+                fh = writer = None  # reopened on the next row
+                pending = 0
+                continue
+        if pending and (row is None or pending >= CSV_FLUSH_ROWS):
+            try:
+                fh.flush()
+            except IOError as e:
+                logger.error("Error flushing CSV: %s", e)
+            pending = 0
+
+def _stop_csv_writer() -> None:
+    if _csv_thread is not None:
+        _csv_q.put(_CSV_STOP)
+        _csv_thread.join(timeout=5)
 
 def log_to_csv(request_data: dict):
-    file_exists = os.path.isfile(CSV_FILE)
+    global _csv_thread
+    if _csv_thread is None:
+        with _csv_thread_lock:
+            if _csv_thread is None:
+                _csv_thread = Thread(target=_csv_writer_loop, name="csv-writer", daemon=True)
+                _csv_thread.start()
+                atexit.register(_stop_csv_writer)
     try:
-        with open(CSV_FILE, 'a', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['timestamp', 'title_name', 'in_game_name', 'coordinates', 'discord_user']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            if not file_exists:
-                writer.writeheader()
-            writer.writerow({
-                'timestamp': request_data.get('timestamp'),
-                'title_name': request_data.get('title_name'),
-                'in_game_name': request_data.get('in_game_name'),
-                'coordinates': request_data.get('coordinates'),
-                'discord_user': request_data.get('discord_user'),
-            })
-    except IOError as e:
-        logger.error("Error writing to CSV: %s", e)
+        _csv_q.put_nowait({k: request_data.get(k) for k in CSV_FIELDS})
+    except queue.Full:
+        logger.warning("CSV queue full; dropping request log row")
 
 def log_action(action: str, **fields):
+    if not logger.isEnabledFor(logging.INFO):
+        return
     try:
-        logger.info("[WEB_ACTION] %s %s", action, json.dumps(fields, default=str))
+        logger.info("[WEB_ACTION] %s %s", action, _json_bytes(fields).decode("utf-8"))
     except Exception:
         logger.info("[WEB_ACTION] %s %s", action, fields)
 
@@ -270,13 +535,9 @@ def log_action(action: str, **fields):
 @contextmanager
 def ensure_app_context():
     """Yield inside a Flask app context if one isn’t already active."""
-    try:
-        from flask import current_app
-        _ = current_app.name
+    if has_app_context():
         yield
         return
-    except Exception:
-        pass
     if APP is not None:
         with APP.app_context():
             yield
@@ -331,7 +592,23 @@ def get_default_guild_id(app: Flask | None = None) -> Optional[int]:
         return next(iter(SERVER_CONFIGS.keys()))
     return None
 
+# (webhook, role_id) per requested guild_id; resolving guild_id=None costs a ServerConfig query.
+# Cleared whenever SERVER_CONFIGS is reloaded (startup, admin server edits).
+_SERVER_CHOICE_CACHE: dict = {}
+
+def invalidate_server_config_cache() -> None:
+    _SERVER_CHOICE_CACHE.clear()
+
 def _choose_server_config(guild_id: int | None):
+    hit = _SERVER_CHOICE_CACHE.get(guild_id)
+    if hit is not None:
+        return hit
+    choice = _resolve_server_config(guild_id)
+    if choice[0]:  # don't pin a miss (e.g. DB briefly unavailable)
+        _SERVER_CHOICE_CACHE[guild_id] = choice
+    return choice
+
+def _resolve_server_config(guild_id: int | None):
     if guild_id and guild_id in SERVER_CONFIGS:
         cfg = SERVER_CONFIGS[guild_id]
         return cfg.get("webhook"), cfg.get("guardian_role_id")
@@ -357,6 +634,33 @@ def _choose_server_config(guild_id: int | None):
     return env_webhook, role
 
 
+# Webhook POSTs run here so Flask/APScheduler threads never wait on Discord
+_WEBHOOK_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="webhook")
+atexit.register(_WEBHOOK_POOL.shutdown, wait=True)
+
+# Keep-alive connection pool shared by every webhook POST (no TLS handshake per send).
+# A webhook POST isn't idempotent: Discord may 5xx after posting, and a read error may follow
+# a delivered message, so only retry what can't have posted: refused connects and 429 (Retry-After).
+_WEBHOOK_SESSION = requests.Session()
+_WEBHOOK_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8, pool_maxsize=16,
+    max_retries=Retry(total=2, connect=2, read=0, status=2, backoff_factor=0.2,
+                      status_forcelist=[429], allowed_methods=frozenset({"POST"}),
+                      respect_retry_after_header=True, raise_on_status=False),
+))
+
+def _log_webhook_result(fut: Future) -> None:
+    try:
+        fut.result().raise_for_status()
+    except requests.exceptions.RequestException as e:
+        logger.error("Webhook send failed: %s", e)
+    except Exception as e:
+        logger.error("Webhook send crashed: %s", e)
+
+# Invariant parts of every webhook message; spliced with per-event fields below
+_PAYLOAD_SKELETON = {"allowed_mentions": {"parse": ["roles"]}}
+_EMBED_SKELETON = {"color": 5814783}
+
 def send_webhook_notification(data, reminder: bool = False, guild_id: int | None = None):
     webhook_url, role_id = _choose_server_config(guild_id)
     if not webhook_url:
@@ -376,115 +680,113 @@ def send_webhook_notification(data, reminder: bool = False, guild_id: int | None
         title = "New Title Reservation"
         content = f"{role_tag} A new title was reserved via the web form."
 
-    fields = [
+    start_utc, end_utc, manage_url = data.get("start_utc"), data.get("end_utc"), data.get("manage_url")
+    fields = [f for f in (
         {"name": "Title", "value": data.get('title_name','-'), "inline": True},
         {"name": "In-Game Name", "value": data.get('in_game_name','-'), "inline": True},
         {"name": "Coordinates", "value": data.get('coordinates','-'), "inline": True},
-    ]
-    if data.get("start_utc"):
-        fields.append({"name": "Start (UTC)", "value": data["start_utc"], "inline": True})
-    if data.get("end_utc"):
-        fields.append({"name": "Ends (UTC)", "value": data["end_utc"], "inline": True})
-    fields.append({"name": "Submitted By", "value": data.get('discord_user','Web Form'), "inline": False})
-    if data.get("manage_url"):
-        fields.append({"name": "Manage", "value": f"[Cancel reservation]({data['manage_url']})", "inline": False})
+        start_utc and {"name": "Start (UTC)", "value": start_utc, "inline": True},
+        end_utc and {"name": "Ends (UTC)", "value": end_utc, "inline": True},
+        {"name": "Submitted By", "value": data.get('discord_user','Web Form'), "inline": False},
+        manage_url and {"name": "Manage", "value": f"[Cancel reservation]({manage_url})", "inline": False},
+    ) if f]
 
     payload = {
+        **_PAYLOAD_SKELETON,
         "content": content,
-        "allowed_mentions": {"parse": ["roles"]},
-        "embeds": [{
-            "title": title,
-            "color": 5814783,
-            "fields": fields,
-            "timestamp": data.get('timestamp')
-        }]
+        "embeds": [{**_EMBED_SKELETON, "title": title, "fields": fields, "timestamp": data.get('timestamp')}],
     }
-    try:
-        resp = requests.post(webhook_url, json=payload, timeout=8)
-        resp.raise_for_status()
-    except requests.exceptions.RequestException as e:
-        logger.error("Webhook send failed: %s", e)
-
-# -------------------- Legacy helpers (DB-mirrored) --------------------
-def title_is_vacant_now(title_name: str) -> bool:
-    with state_lock:
-        t = state.get('titles', {}).get(title_name, {})
-        if not t.get('holder'):
-            return True
-        exp_str = t.get('expiry_date')
-    if not exp_str:
-        return False
-    expiry_dt = parse_iso_utc(exp_str)
-    return bool(expiry_dt and now_utc() >= expiry_dt)
-
-def _db_upsert_active_title(title_name: str, ign: str, start_dt: datetime, end_dt: Optional[datetime]):
-    if start_dt.tzinfo is None: start_dt = start_dt.replace(tzinfo=UTC)
-    if end_dt and end_dt.tzinfo is None: end_dt = end_dt.replace(tzinfo=UTC)
+    fut = _WEBHOOK_POOL.submit(
+        _WEBHOOK_SESSION.post, webhook_url, data=_json_bytes(payload),
+        headers={"Content-Type": "application/json"}, timeout=8,
+    )
+    fut.add_done_callback(_log_webhook_result)
+
+# -------------------- ActiveTitle helpers --------------------
+def _db_delete_active_title(title_name: str) -> bool:
     with ensure_app_context():
         row = ActiveTitle.query.filter_by(title_name=title_name).first()
         if not row:
-            row = ActiveTitle(title_name=title_name, holder=ign, claim_at=start_dt, expiry_at=end_dt)
-            db.session.add(row)
-        else:
-            row.holder, row.claim_at, row.expiry_at = ign, start_dt, end_dt
+            return False
+        db.session.delete(row)
         db.session.commit()
-
-def _db_delete_active_title(title_name: str):
-    with ensure_app_context():
-        row = ActiveTitle.query.filter_by(title_name=title_name).first()
-        if row:
-            db.session.delete(row)
-            db.session.commit()
+        return True
 
 # -------------------- Safe shift-hours accessor (works outside request context) --------------------
+# Cached Setting("shift_hours"): _set_shift_hours refreshes it in-process; the TTL picks up
+# changes written by anything else (another worker, a manual DB edit)
+SHIFT_HOURS_TTL = 30.0  # seconds
+_SHIFT_HOURS: Optional[int] = None
+_SHIFT_HOURS_AT = 0.0
+
 def _safe_shift_hours(default: int = 12) -> int:
+    global _SHIFT_HOURS, _SHIFT_HOURS_AT
+    if _SHIFT_HOURS is not None and time.monotonic() - _SHIFT_HOURS_AT < SHIFT_HOURS_TTL:
+        return _SHIFT_HOURS
     try:
         with ensure_app_context():
-            return int(db_get_shift_hours())
+            _SHIFT_HOURS = int(db_get_shift_hours())
+        _SHIFT_HOURS_AT = time.monotonic()
+        return _SHIFT_HOURS
     except Exception:
-        return default
-
-def activate_slot(title_name: str, ign: str, start_dt: datetime):
-    end_dt = None if title_name == "Guardian of Harmony" else start_dt + timedelta(hours=_safe_shift_hours())
-    with state_lock:
-        state['titles'].setdefault(title_name, {})
-        state['titles'][title_name].update({
-            'holder': {'name': ign, 'coords': '-', 'discord_id': 0},
-            'claim_date': normalize_slot_dt(start_dt).isoformat(),
-            'expiry_date': (None if end_dt is None else normalize_slot_dt(end_dt).isoformat()),
-        })
-        activated = state.setdefault('activated_slots', {})
-        slot_key = iso_slot_key_naive(start_dt)
-        activated.setdefault(title_name, {})[slot_key] = True
-        _save_state_unlocked()
-    try:
-        _db_upsert_active_title(title_name, ign, start_dt, end_dt)
-    except Exception as e:
-        logger.exception("DB upsert ActiveTitle failed: %s", e)
-
-def _scan_expired_titles(now_dt: datetime) -> list[str]:
-    expired = []
-    with state_lock:
-        for title_name, data in state.get('titles', {}).items():
-            exp = data.get('expiry_date')
-            if data.get('holder') and exp:
-                exp_dt = parse_iso_utc(exp)
-                if exp_dt and now_dt >= exp_dt:
-                    expired.append(title_name)
-    return expired
+        return _SHIFT_HOURS if _SHIFT_HOURS is not None else default
+
+def _set_shift_hours(hours: int) -> None:
+    """db_set_shift_hours + refresh the cached value used by the hot paths."""
+    global _SHIFT_HOURS, _SHIFT_HOURS_AT
+    db_set_shift_hours(hours)
+    _SHIFT_HOURS, _SHIFT_HOURS_AT = int(hours), time.monotonic()
+
+@lru_cache(maxsize=4)
+def _allowed_slots(shift_hours: int) -> frozenset[str]:
+    """Slot start times (HH:MM) for a shift length; invariant per shift_hours."""
+    return frozenset(compute_slots(shift_hours))
+
+# Bumped by every committed ORM session (web, bot, admin, jobs); read-mostly views key
+# short-lived caches on it so a write is visible on the very next request
+_data_rev = 0
+_data_rev_lock = Lock()  # commits land from Waitress, APScheduler and bot threads; `+= 1` isn't atomic
+
+@event.listens_for(Session, "after_commit")
+def _bump_data_rev(_session):
+    global _data_rev
+    with _data_rev_lock:
+        _data_rev += 1
+
+def data_revision() -> int:
+    return _data_rev
+
+def _scan_expiries(now_dt: datetime, horizon: float) -> tuple[list[str], Optional[datetime]]:
+    """(titles already expired, earliest expiry within the next `horizon` seconds) in one
+    indexed range scan on active_title.expiry_at."""
+    with ensure_app_context():
+        rows = db.session.execute(
+            select(ActiveTitle.title_name, ActiveTitle.expiry_at)
+            .where(ActiveTitle.expiry_at.isnot(None))
+            .where(ActiveTitle.expiry_at <= now_dt + timedelta(seconds=horizon))
+        ).all()
+    expired, upcoming = [], []
+    for title_name, expiry_at in rows:
+        if expiry_at.tzinfo is None:
+            expiry_at = expiry_at.replace(tzinfo=UTC)
+        (expired if expiry_at <= now_dt else upcoming).append((expiry_at, title_name))
+    return [t for _, t in expired], (min(upcoming)[0] if upcoming else None)
 
 def _release_title_blocking(title_name: str) -> bool:
-    with state_lock:
+    released = False
+    with _lk(title_name):
         titles = state.get('titles', {})
-        if title_name not in titles:
-            return False
-        titles[title_name].update({'holder': None, 'claim_date': None, 'expiry_date': None})
-        _save_state_unlocked()
+        if title_name in titles:
+            titles[title_name] = TitleState()
+            released = True
+    if released:
+        save_state()
     try:
-        _db_delete_active_title(title_name)
+        # DB is authoritative (admin assigns never touch the JSON mirror), so always clear it
+        released = _db_delete_active_title(title_name) or released
     except Exception as e:
         logger.exception("DB delete ActiveTitle failed: %s", e)
-    return True
+    return released
 
 # -------------------- Notification settings helpers --------------------
 DEFAULT_NOTIFY_TITLES = ["Architect", "General", "Governor", "Prefect"]
@@ -519,60 +821,60 @@ intents.members = True
 intents.message_content = True
 bot = commands.Bot(command_prefix='!', intents=intents)
 
-def snapshot_titles_for_embed():
-    with state_lock:
-        titles_snapshot = {k: dict(v) for k, v in state.get('titles', {}).items()}
-    rows = []
-    for title_name in ORDERED_TITLES:
-        data = titles_snapshot.get(title_name, {}) or {}
-        holder = (data.get('holder') or {}).get('name') or None
-        expires_txt = "Never" if (holder and title_name == "Guardian of Harmony") else "—"
-        exp_str = data.get('expiry_date')
-        if exp_str:
-            expiry_dt = parse_iso_utc(exp_str)
-            if expiry_dt:
-                delta = expiry_dt - now_utc()
-                expires_txt = "Expired" if delta.total_seconds() <= 0 else str(timedelta(seconds=int(delta.total_seconds())))
-            else:
-                expires_txt = "Invalid"
-        rows.append((title_name, holder, expires_txt))
-    return rows
-
 # Core reservation (used by web + Discord)
+_COORDS_RE = re.compile(r"\s*\d+\s*:\s*\d+\s*")
+
+# Dialects with INSERT ... ON CONFLICT DO NOTHING ... RETURNING; others take the SELECT-first path.
+# SQLite only gained RETURNING in 3.35; older libraries would raise instead of falling back.
+_CONFLICT_INSERT = {"postgresql": pg_insert}
+if sqlite3.sqlite_version_info >= (3, 35):
+    _CONFLICT_INSERT["sqlite"] = sqlite_insert
+
 def _reserve_slot_core(title_name: str, ign: str, coords: str, start_dt: datetime, source: str, who: str, guild_id: int | None = None):
     if start_dt.tzinfo is None:
         start_dt = start_dt.replace(tzinfo=UTC)
-    if start_dt <= now_utc():
+    now = now_utc()  # one read for the past-check, the log row and the webhook payload
+    if start_dt <= now:
         raise ValueError("The chosen time is in the past.")
-    allowed = set(compute_slots(_safe_shift_hours()))
+    allowed = _allowed_slots(_safe_shift_hours())
     if start_dt.strftime("%H:%M") not in allowed:
         raise ValueError(f"Time must be one of {sorted(allowed)} UTC.")
     coords = (coords or "-").strip()
-    if coords != "-" and not re.fullmatch(r"\s*\d+\s*:\s*\d+\s*", coords):
+    if coords != "-" and not _COORDS_RE.fullmatch(coords):
         raise ValueError("Coordinates must be like 123:456.")
     slot_dt = normalize_slot_dt(start_dt)
     slot_ts = slot_dt.strftime("%Y-%m-%dT%H:%M:%S")
-    slot_key = iso_slot_key_naive(slot_dt)
 
+    new_token = secrets.token_urlsafe(32)
     with ensure_app_context():
-        res = Reservation.query.filter_by(title_name=title_name, slot_dt=slot_dt).first()
+        # Common case is a free slot: try the INSERT first and let uix_reservation_title_slotdt
+        # turn a taken slot into a no-op, instead of SELECT-then-INSERT
+        ins = _CONFLICT_INSERT.get(db.engine.dialect.name)
+        created = ins is not None and db.session.execute(
+            ins(Reservation)
+            .values(title_name=title_name, ign=ign, coords=(coords or "-"),
+                    slot_dt=slot_dt, slot_ts=slot_ts, cancel_token=new_token)
+            .on_conflict_do_nothing()
+            .returning(Reservation.id)
+        ).first() is not None
+        res = None if created else Reservation.query.filter_by(title_name=title_name, slot_dt=slot_dt).first()
         if res:
             if res.ign != ign or ((coords or "-") != (res.coords or "-")):
                 raise ValueError(f"Slot already reserved by {res.ign}.")
             if not res.cancel_token:
-                res.cancel_token = secrets.token_urlsafe(32)
-                db.session.flush()
+                # Only legacy rows lack a token; idempotent re-submits otherwise write nothing
+                res.cancel_token = new_token
+                db.session.commit()
             cancel_token_value = res.cancel_token
-            db.session.commit()
         else:
-            cancel_token_value = secrets.token_urlsafe(32)
-            res = Reservation(
-                title_name=title_name, ign=ign, coords=(coords or "-"),
-                slot_dt=slot_dt, slot_ts=slot_ts, cancel_token=cancel_token_value
-            )
-            db.session.add(res)
+            cancel_token_value = new_token
+            if not created:
+                db.session.add(Reservation(
+                    title_name=title_name, ign=ign, coords=(coords or "-"),
+                    slot_dt=slot_dt, slot_ts=slot_ts, cancel_token=new_token
+                ))
             db.session.add(RequestLog(
-                timestamp=now_utc().strftime("%Y-%m-%d %H:%M:%S"),
+                timestamp=now.strftime("%Y-%m-%d %H:%M:%S"),
                 title_name=title_name, in_game_name=ign,
                 coordinates=(coords or "-"), discord_user=who or source
             ))
@@ -580,39 +882,30 @@ def _reserve_slot_core(title_name: str, ign: str, coords: str, start_dt: datetim
 
     manage_url = build_public_url(f"/cancel/{cancel_token_value}") if cancel_token_value else None
 
-    with state_lock:
-        sched = state.setdefault("schedules", {}).setdefault(title_name, {})
-        if slot_key in sched:
-            ex = sched[slot_key]
-            ex_ign = ex["ign"] if isinstance(ex, dict) else str(ex)
-            if ex_ign != ign:
-                raise ValueError(f"Slot already reserved by {ex_ign}.")
-        sched[slot_key] = {"ign": ign, "coords": (coords or "-")}
-        _save_state_unlocked()
-
+    # Non-blocking: server config is cached and the POST itself goes to the webhook pool
+    end_dt = slot_dt + timedelta(hours=_safe_shift_hours())
     try:
-        end_dt = slot_dt + timedelta(hours=_safe_shift_hours())
         send_webhook_notification({
             "title_name": title_name,
             "in_game_name": ign,
             "coordinates": (coords or "-"),
-            "timestamp": now_utc().isoformat(),
+            "timestamp": now.isoformat(),
             "discord_user": who or source,
             "manage_url": manage_url,
             "start_utc": slot_dt.strftime("%Y-%m-%d %H:%M"),
             "end_utc":   end_dt.strftime("%Y-%m-%d %H:%M"),
         }, reminder=False, guild_id=guild_id)
     except Exception as e:
-        logger.error("Immediate notification failed: %s", e)
+        logger.error("Webhook notification failed: %s", e)
 
     try:
-        airtable_upsert("reservation", {
+        airtable_append("reservation", {
             "Title": title_name, "IGN": ign, "Coordinates": (coords or "-"),
             "SlotStartUTC": slot_dt, "SlotEndUTC": end_dt,
             "Source": source, "DiscordUser": who or source,
         })
     except Exception as e:
-        logger.error("Airtable upsert failed: %s", e)
+        logger.error("Airtable append failed: %s", e)
 
 # --- Discord commands/cog (no reminder loop) ---
 def is_admin_or_manager():
@@ -624,6 +917,7 @@ def is_admin_or_manager():
 class TitleCog(commands.Cog, name="TitleManager"):
     def __init__(self, bot_instance):
         self.bot = bot_instance
+        self._ann_channel: Optional[discord.TextChannel] = None
         self.title_check_loop.start()
 
     async def announce(self, message: str):
@@ -632,31 +926,74 @@ class TitleCog(commands.Cog, name="TitleManager"):
         if not channel_id:
             return
         try:
-            channel = await self.bot.fetch_channel(channel_id)
+            # Keyed on the configured id, so a config change re-resolves; gateway cache
+            # before REST, which is only hit on a miss (e.g. channel not cached yet)
+            channel = self._ann_channel
+            if channel is None or channel.id != int(channel_id):
+                channel = self.bot.get_channel(channel_id) or await self.bot.fetch_channel(channel_id)
+                self._ann_channel = channel if isinstance(channel, discord.TextChannel) else None
             if isinstance(channel, discord.TextChannel):
                 await channel.send(message)
         except Exception as e:
+            self._ann_channel = None
             logger.error("announce failed: %s", e)
 
-    async def force_release_logic(self, title_name: str, reason: str):
-        ok = await asyncio.to_thread(_release_title_blocking, title_name)
-        if not ok:
-            return
-        await self.announce(f"TITLE RELEASED: **'{title_name}'** is now available. Reason: {reason}")
-        logger.info("[RELEASE] %s released. Reason: %s", title_name, reason)
-
-    @tasks.loop(seconds=60)
+    async def release_expired(self, title_names: list[str]):
+        """Release the titles concurrently (per-title locks), then post one announcement for the batch."""
+        results = await asyncio.gather(
+            *(asyncio.to_thread(_release_title_blocking, t) for t in title_names),
+            return_exceptions=True,
+        )
+        released = []
+        for title_name, ok in zip(title_names, results):
+            if isinstance(ok, BaseException):
+                logger.error("release of %s failed: %s", title_name, ok)
+            elif ok:
+                released.append(title_name)
+                logger.info("[RELEASE] %s released. Reason: Title expired.", title_name)
+        if released:
+            names = ", ".join(f"**'{t}'**" for t in released)
+            await self.announce(f"TITLE RELEASED: {names} {'is' if len(released) == 1 else 'are'} now available. Reason: Title expired.")
+
+    # Sleeps until the next known expiry, but never longer than this: admin routes write
+    # ActiveTitle directly without waking the loop
+    CHECK_MAX_INTERVAL = 60.0
+
+    @tasks.loop(seconds=CHECK_MAX_INTERVAL)
     async def title_check_loop(self):
         now = now_utc()
-        to_release = await asyncio.to_thread(_scan_expired_titles, now)
-        for title_name in to_release:
-            await self.force_release_logic(title_name, "Title expired.")
+        try:
+            to_release, next_expiry = await asyncio.to_thread(_scan_expiries, now, self.CHECK_MAX_INTERVAL)
+            if to_release:
+                await self.release_expired(to_release)
+        except Exception as e:
+            # tasks.loop only survives its reconnect errors; a DB hiccup must not end auto-release
+            logger.error("title_check_loop failed: %s", e)
+            to_release, next_expiry = [], None
+        delay = self.CHECK_MAX_INTERVAL
+        if next_expiry is not None:
+            delay = min(delay, max(1.0, (next_expiry - now_utc()).total_seconds() + 0.5))
+        if delay != self.title_check_loop.seconds:
+            self.title_check_loop.change_interval(seconds=delay)
 
     @title_check_loop.before_loop
     async def _wait_ready(self):
         await self.bot.wait_until_ready()
 
 # -------------------- APScheduler job --------------------
+# De-dupe keys only matter until their slot starts; older ones just bloat every state write
+SENT_REMINDER_RETENTION = timedelta(days=1)
+
+def _prune_sent_reminders(now_dt: datetime) -> None:
+    """Drop 'title|slot_iso' keys whose slot is past retention. Caller holds state_lock."""
+    sent = state['sent_reminders']
+    cutoff = now_dt - SENT_REMINDER_RETENTION
+    keep = [k for k in sent if (parse_iso_utc(k.rpartition('|')[2]) or now_dt) >= cutoff]
+    if len(keep) != len(sent):
+        sent[:] = keep
+        _sent_reminder_keys.intersection_update(keep)
+        save_state()
+
 def discord_reminder_job():
     """
     Runs every 30s. Sends Discord reminders X minutes before reservations start,
@@ -686,16 +1023,15 @@ def discord_reminder_job():
                 .order_by(Reservation.slot_dt.asc())
                 .all()
             )
-        logger.debug("reminder: %d row(s) in window %s..%s for titles=%s",
-                     len(rows), window_start.isoformat(), window_end.isoformat(), sorted(titles))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("reminder: %d row(s) in window %s..%s for titles=%s",
+                         len(rows), window_start.isoformat(), window_end.isoformat(), sorted(titles))
 
-        with state_lock:
-            sent_keys = set(state.setdefault('sent_reminders', []))
         to_send = []
         for r in rows:
             slot_dt = r.slot_dt.replace(tzinfo=UTC) if r.slot_dt.tzinfo is None else r.slot_dt.astimezone(UTC)
             key = f"{r.title_name}|{slot_dt.isoformat()}"
-            if key in sent_keys:
+            if key in _sent_reminder_keys:
                 continue
             to_send.append((r, key, slot_dt))
 
@@ -718,8 +1054,12 @@ def discord_reminder_job():
             )
             with state_lock:
                 state['sent_reminders'].append(key)
-                _save_state_unlocked()
+                _sent_reminder_keys.add(key)
+            save_state()
             logger.info("reminder: sent %s", key)
+
+        with state_lock:
+            _prune_sent_reminders(now)
     except Exception as e:
         logger.error("discord_reminder_job failed: %s", e)
 
@@ -737,6 +1077,21 @@ def _create_all_with_retry(logger: logging.Logger, attempts: int = 8) -> None:
             time.sleep(delay)
             delay = min(delay * 2, 30)
 
+def _keyset_chunks(stmt, id_col, size: int = BACKFILL_CHUNK):
+    """
+    Yield `stmt` rows in id order, `size` at a time. Each chunk is its own
+    LIMIT query keyed on the last id seen, so callers may commit between chunks
+    and memory stays bounded by one chunk (the first column must be the id).
+    """
+    last_id = None
+    while True:
+        q = stmt if last_id is None else stmt.where(id_col > last_id)
+        rows = db.session.execute(q.order_by(id_col).limit(size)).all()
+        if not rows:
+            return
+        yield rows
+        last_id = rows[-1][0]
+
 def _ensure_sqlite_dir(sqlite_uri: str) -> None:
     if not sqlite_uri.startswith("sqlite:"):
         return
@@ -760,19 +1115,14 @@ def _sqlite_pragmas(dbapi_connection, connection_record):
 def _rehydrate_state_from_db_actives():
     with ensure_app_context():
         rows = ActiveTitle.query.all()
-    with state_lock:
-        titles = state.setdefault('titles', {})
+    with _all_state_locks():
+        titles = state['titles']
         for row in rows:
             start = row.claim_at if row.claim_at.tzinfo else row.claim_at.replace(tzinfo=UTC)
             exp = row.expiry_at
             if exp and exp.tzinfo is None:
                 exp = exp.replace(tzinfo=UTC)
-            titles.setdefault(row.title_name, {})
-            titles[row.title_name].update({
-                'holder': {'name': row.holder, 'coords': '-', 'discord_id': 0},
-                'claim_date': start.isoformat(),
-                'expiry_date': (exp.isoformat() if exp else None),
-            })
+            titles[row.title_name] = TitleState(row.holder, start, exp)
     save_state()
 
 # -------------------- Flask factory --------------------
@@ -814,11 +1164,16 @@ def create_app() -> Flask:
         insp = inspect(db.engine)
 
         try:
-            for t in Title.query.all():
-                if t.name == "Guardian of Harmony":
-                    t.requestable = False
-                elif t.requestable is None:
-                    t.requestable = True
+            # Two set-based UPDATEs instead of loading and dirtying every Title row
+            db.session.execute(
+                update(Title).where(Title.name == "Guardian of Harmony").values(requestable=False)
+            )
+            db.session.execute(
+                update(Title)
+                .where(Title.name != "Guardian of Harmony")
+                .where(Title.requestable.is_(None))
+                .values(requestable=True)
+            )
             db.session.commit()
         except Exception:
             db.session.rollback()
@@ -831,19 +1186,33 @@ def create_app() -> Flask:
             db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_reservation_slot_dt ON reservation(slot_dt)"))
             db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_reservation_title ON reservation(title_name)"))
             db.session.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS uix_reservation_title_slotdt ON reservation(title_name, slot_dt)"))
+            db.session.execute(text("CREATE INDEX IF NOT EXISTS ix_active_title_expiry_at ON active_title(expiry_at)"))
             db.session.commit()
         except Exception:
             db.session.rollback()
 
         try:
-            missing = Reservation.query.filter(Reservation.cancel_token.is_(None) | (Reservation.cancel_token == "")).all()
-            for r in missing:
-                r.cancel_token = secrets.token_urlsafe(32)
-            if missing:
+            missing = (
+                select(Reservation.id)
+                .where(Reservation.cancel_token.is_(None) | (Reservation.cancel_token == ""))
+            )
+            for chunk in _keyset_chunks(missing, Reservation.id):
+                db.session.execute(update(Reservation), [
+                    {"id": rid, "cancel_token": secrets.token_urlsafe(32)} for (rid,) in chunk
+                ])
                 db.session.commit()
         except Exception:
             db.session.rollback()
 
+        # /cancel/<token> lookups; create_all only builds this for brand-new tables
+        # (same name as the model's index=True, so it's a no-op there). Runs after the
+        # backfill above so legacy '' tokens can't collide.
+        try:
+            db.session.execute(text("CREATE UNIQUE INDEX IF NOT EXISTS ix_reservation_cancel_token ON reservation(cancel_token)"))
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+
         try:
             changed = False
             if db.session.get(Setting, "notify_enabled") is None:
@@ -877,6 +1246,7 @@ def create_app() -> Flask:
         except Exception as e:
             SERVER_CONFIGS.update(_parse_multi_server_configs())
             logger.warning("ServerConfig load fallback: %s", e)
+        invalidate_server_config_cache()
 
         # Register web routes
         if _register_routes is not None:
@@ -890,9 +1260,9 @@ def create_app() -> Flask:
                     log_to_csv=log_to_csv, log_action=log_action,
                     parse_iso_utc=parse_iso_utc, now_utc=now_utc,
                     iso_slot_key_naive=iso_slot_key_naive,
-                    title_is_vacant_now=title_is_vacant_now,
                     get_shift_hours=_safe_shift_hours,  # safe accessor
                     bot=bot, state_lock=state_lock,
+                    data_revision=data_revision,
                     send_webhook_notification=send_webhook_notification,
                     db=db,
                     models=dict(Title=Title, Reservation=Reservation, ActiveTitle=ActiveTitle, RequestLog=RequestLog, Setting=Setting),
@@ -901,11 +1271,12 @@ def create_app() -> Flask:
                         requestable_title_names=requestable_title_names,
                         title_status_cards=title_status_cards,
                         schedules_by_title=schedules_by_title,
-                        set_shift_hours=db_set_shift_hours,
+                        set_shift_hours=_set_shift_hours,
                         schedule_lookup=schedule_lookup,
+                        allowed_slots=_allowed_slots,
                     ),
                     reserve_slot_core=_reserve_slot_core,
-                    airtable_upsert=airtable_upsert,
+                    airtable_append=airtable_append,
                 )
             )
         else:
@@ -919,9 +1290,10 @@ def create_app() -> Flask:
             deps=dict(
                 ADMIN_PIN=ADMIN_PIN,
                 get_shift_hours=_safe_shift_hours,   # safe accessor
-                db_set_shift_hours=db_set_shift_hours,
+                db_set_shift_hours=_set_shift_hours,
                 send_webhook_notification=send_webhook_notification,
                 SERVER_CONFIGS=SERVER_CONFIGS,
+                invalidate_server_config_cache=invalidate_server_config_cache,
                 db=db,
                 models=dict(
                     Title=Title, Reservation=Reservation, ActiveTitle=ActiveTitle,
@@ -933,7 +1305,7 @@ def create_app() -> Flask:
                     schedule_lookup=schedule_lookup,
                     title_status_cards=title_status_cards,
                 ),
-                airtable_upsert=airtable_upsert,
+                airtable_append=airtable_append,
             )
         )
 
@@ -983,6 +1355,9 @@ def create_app() -> Flask:
     return app
 
 # -------------------- Discord lifecycle --------------------
+# on_ready fires again on every gateway reconnect; the command tree only changes on deploy
+_tree_synced = False
+
 @bot.event
 async def on_ready():
     load_state()
@@ -994,20 +1369,28 @@ async def on_ready():
     if not bot.get_cog("TitleManager"):
         await bot.add_cog(TitleCog(bot))
 
-    try:
-        # Keep slash command tree minimal for stability; add more as needed
-        await bot.tree.sync()
-    except Exception as e:
-        logger.error("Slash sync failed: %s", e)
+    global _tree_synced
+    if not _tree_synced:
+        try:
+            # Keep slash command tree minimal for stability; add more as needed
+            await bot.tree.sync()
+            _tree_synced = True
+        except Exception as e:
+            logger.error("Slash sync failed: %s", e)
 
     logger.info('%s connected to Discord', bot.user.name)
 
 # -------------------- Entrypoint --------------------
 def run_flask_app(app: Flask):
     port = int(os.getenv("PORT", "10000"))
-    threads = int(os.getenv("WAITRESS_THREADS", "8"))
+    # Webhooks/Airtable/state writes are all off the request thread now, so a few threads
+    # go a long way; idle keep-alive sockets are reaped sooner than waitress' 120s default.
+    threads = int(os.getenv("WAITRESS_THREADS", str(max(8, (os.cpu_count() or 1) * 2))))
+    connection_limit = int(os.getenv("WAITRESS_CONNECTION_LIMIT", "500"))
+    channel_timeout = int(os.getenv("WAITRESS_CHANNEL_TIMEOUT", "30"))
     logger.info("Starting Flask server on port %d with %d threads", port, threads)
-    serve(app, host='0.0.0.0', port=port, threads=threads)
+    serve(app, host='0.0.0.0', port=port, threads=threads,
+          connection_limit=connection_limit, channel_timeout=channel_timeout)
 
 if __name__ == "__main__":
     app = create_app()
@@ -3,7 +3,9 @@
 from flask_sqlalchemy import SQLAlchemy
 from sqlalchemy import ForeignKey
 
-db = SQLAlchemy()
+# Sessions are scoped to an app context, so keeping loaded attributes across commit()
+# is safe and saves a SELECT every time a committed row is read again
+db = SQLAlchemy(session_options={"expire_on_commit": False})
 
 # ---------------- Titles ----------------
 class Title(db.Model):
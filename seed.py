@@ -81,7 +81,7 @@ def _sqlite_pragmas(dbapi_connection, connection_record):
 uri = app.config["SQLALCHEMY_DATABASE_URI"]
 _ensure_sqlite_dir(uri)
 
-DEFAULT_TITLES = [
+DEFAULT_TITLES = (
     {"name": "Guardian of Harmony", "icon_url": "/static/icons/guardian_harmony.png", "requestable": False},
     {"name": "Guardian of Fire",    "icon_url": "/static/icons/guardian_fire.png",    "requestable": True},
     {"name": "Guardian of Water",   "icon_url": "/static/icons/guardian_water.png",   "requestable": True},
@@ -91,7 +91,7 @@ DEFAULT_TITLES = [
     {"name": "General",             "icon_url": "/static/icons/general.png",          "requestable": True},
     {"name": "Governor",            "icon_url": "/static/icons/governor.png",         "requestable": True},
     {"name": "Prefect",             "icon_url": "/static/icons/prefect.png",          "requestable": True},
-]
+)
 
 DEFAULT_SETTINGS = {"shift_hours": "12"}
 
@@ -2,6 +2,7 @@
 
 import os
 import csv
+import time
 import asyncio
 from datetime import datetime, timedelta, timezone
 from flask import render_template, request, redirect, url_for, flash, session
@@ -11,13 +12,14 @@ def register_routes(app, deps):
     Expected deps:
       ORDERED_TITLES, TITLES_CATALOG, ICON_FILES, REQUESTABLE, ADMIN_PIN,
       state, save_state, log_action, log_to_csv, send_webhook_notification,
-      parse_iso_utc, now_utc, iso_slot_key_naive, title_is_vacant_now,
+      parse_iso_utc, now_utc, iso_slot_key_naive,
       get_shift_hours,
+      db_helpers (dict with title_status_cards, schedule_lookup [required];
+                  set_shift_hours, compute_slots, requestable_title_names, allowed_slots),
       # optional
       bot,
-      db_helpers (dict with set_shift_hours, compute_slots, requestable_title_names,
-                  title_status_cards, schedule_lookup),
       send_to_log_channel (async func),
+      data_revision (callable -> int, bumped on every DB commit),
       reserve_slot_core (callable: title, ign, coords, start_dt, source, who, guild_id)
     """
     # ----- Unpack deps (robustly) -----
@@ -37,11 +39,12 @@ def register_routes(app, deps):
     parse_iso_utc  = deps['parse_iso_utc']
     now_utc        = deps['now_utc']
     iso_slot_key_naive = deps['iso_slot_key_naive']
-    title_is_vacant_now = deps['title_is_vacant_now']
     get_shift_hours = deps['get_shift_hours']
 
     reserve_slot_core = deps.get('reserve_slot_core')  # required for DB-backed booking
 
+    data_revision = deps.get('data_revision')
+
     bot            = deps.get('bot')
     db_helpers     = deps.get('db_helpers', {}) or {}
     set_shift_hours = deps.get('set_shift_hours') or db_helpers.get('set_shift_hours') or (lambda *_: None)
@@ -53,8 +56,10 @@ def register_routes(app, deps):
     requestable_title_names = db_helpers.get('requestable_title_names') or (
         lambda: sorted([t for t in ORDERED_TITLES if t != "Guardian of Harmony"])
     )
-    title_status_cards = db_helpers.get('title_status_cards')
-    schedule_lookup_db = db_helpers.get('schedule_lookup')  # optional DB-driven grid
+    # The dashboard reads titles and reservations from the DB only
+    title_status_cards = db_helpers['title_status_cards']
+    schedule_lookup_db = db_helpers['schedule_lookup']
+    allowed_slots = db_helpers.get('allowed_slots') or (lambda sh: frozenset(compute_slots(sh)))  # memoized in main
 
     # Optional: async logger channel
     async def _noop_log_channel(_bot, _msg):
@@ -63,6 +68,11 @@ def register_routes(app, deps):
 
     UTC = timezone.utc
 
+    # DB-driven dashboard payload, reused while no commit has happened and it's this fresh
+    # (the cards' "expires in" text is the only thing that ages on its own)
+    DASHBOARD_CACHE_TTL = 2.0
+    _dashboard_cache = [None]  # [((rev, today), built_at_monotonic, template_kwargs)]
+
     # ----- Utilities -----
     class _ImmediateResult:
         """Tiny wrapper so callers can still call .result(timeout=...) even when we ran sync."""
@@ -94,110 +104,14 @@ def register_routes(app, deps):
         except Exception:
             return None
 
-    def _reservation_to_ign(reservation):
-        return reservation.get('ign') if isinstance(reservation, dict) else (str(reservation) if reservation is not None else "-")
-
-    def _reservation_to_coords(reservation):
-        if isinstance(reservation, dict):
-            return reservation.get('coords', '-')
-        return '-'
-
-    def _safe_parse_iso(k: str):
-        """Parse ISO robustly; always return UTC-aware datetime or None."""
-        try:
-            dt = parse_iso_utc(k)
-            if dt is not None:
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=UTC)
-                return dt
-        except Exception:
-            pass
-        try:
-            dt = datetime.fromisoformat(k)
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=UTC)
-            return dt
-        except Exception:
-            return None
-
-    # ----- ALWAYS ensure state shape before any request -----
-    @app.before_request
-    def _ensure_state_keys():
-        # Top-level keys
-        if 'titles' not in state: state['titles'] = {}
-        if 'schedules' not in state: state['schedules'] = {}
-        if 'config' not in state: state['config'] = {}
-        if 'sent_reminders' not in state: state['sent_reminders'] = []
-        if 'activated_slots' not in state: state['activated_slots'] = {}
-        if 'approvals' not in state: state['approvals'] = {}
-        # Each title entry present
-        titles_dict = state['titles']
-        for title_name, details in TITLES_CATALOG.items():
-            if title_name not in titles_dict:
-                titles_dict[title_name] = {
-                    'holder': None,
-                    'queue': [],
-                    'claim_date': None,
-                    'expiry_date': None,
-                    'pending_claimant': None,
-                    'icon': details.get('image'),
-                    'buffs': details.get('effects')
-                }
+    # state's top-level keys (main._empty_state) always exist; per-title entries are
+    # main.TitleState objects owned by main.load_state()
 
     # =========================
     # Public pages
     # =========================
-    @app.route("/")
-    def dashboard():
-        # Prefer DB-driven status cards; fall back to legacy state if helper isn't wired
-        if title_status_cards:
-            titles_data = title_status_cards()
-        else:
-            titles_data = []
-            titles_dict = state.get('titles', {})
-            for title_name in ORDERED_TITLES:
-                cat = TITLES_CATALOG.get(title_name, {})
-                data = titles_dict.get(title_name, {})
-                holder_info = "None"
-                if data.get('holder'):
-                    holder = data['holder']
-                    holder_info = f"{holder.get('name','?')} ({holder.get('coords','-')})"
-
-                remaining = "—"
-                if data.get('expiry_date'):
-                    try:
-                        expiry = _safe_parse_iso(data['expiry_date'])
-                        if expiry:
-                            delta = expiry - now_utc()
-                            remaining = str(timedelta(seconds=int(delta.total_seconds()))) if delta.total_seconds() > 0 else "Expired"
-                        else:
-                            remaining = "Invalid"
-                    except Exception:
-                        remaining = "Invalid"
-
-                # Next reservation from legacy state
-                next_slot_key = next_ign = None
-                sched = state.get('schedules', {}).get(title_name, {})
-                future = []
-                for k, v in sched.items():
-                    dt = _safe_parse_iso(k)
-                    if dt and dt >= now_utc():
-                        future.append((dt, v))
-                if future:
-                    future.sort(key=lambda x: x[0])
-                    dt, v = future[0]
-                    next_slot_key = dt.strftime("%Y-%m-%dT%H:%M:%S")
-                    next_ign = _reservation_to_ign(v)
-
-                icon_path = ICON_FILES.get(title_name) or cat.get('image') or ""
-                titles_data.append({
-                    'name': title_name,
-                    'holder': holder_info,
-                    'expires_in': remaining,
-                    'icon': icon_path,
-                    'buffs': cat.get('effects', []),
-                    'next_reserved': (f"{next_slot_key} by {next_ign}" if (next_slot_key and next_ign) else "—")
-                })
+    def _dashboard_context() -> dict:
+        titles_data = title_status_cards()
 
         today = now_utc().date()
         days = [(today + timedelta(days=i)) for i in range(7)]
@@ -206,42 +120,33 @@ def register_routes(app, deps):
         shift = int(get_shift_hours())
         hours = compute_slots(shift)             # e.g., 00:00, 04:00, 08:00, ...
         requestable = requestable_title_names()  # DB-truth, excludes unrequestable
-        cfg = state.get('config', {})
 
-        # Build schedule grid
-        if schedule_lookup_db:
-            schedule_grid = schedule_lookup_db(days, hours)
-        else:
-            allowed_hours = set(hours)
-            schedule_grid = {}
-            for title_name, sched in state.get('schedules', {}).items():
-                for k, v in sched.items():
-                    dt = _safe_parse_iso(k)
-                    if not dt:
-                        continue
-                    dkey = dt.date().isoformat()
-                    tkey = dt.strftime("%H:%M")
-                    if tkey not in allowed_hours:
-                        continue
-                    day_map = schedule_grid.setdefault(dkey, {})
-                    time_map = day_map.setdefault(tkey, {})
-                    if isinstance(v, dict):
-                        time_map[title_name] = {"ign": v.get("ign", "-"), "coords": v.get("coords", "-")}
-                    else:
-                        time_map[title_name] = {"ign": str(v), "coords": "-"}
+        schedule_grid = schedule_lookup_db(days, hours)
 
-        return render_template(
-            'dashboard.html',
+        return dict(
             titles=titles_data,
             days=days,
             hours=hours,
             schedule_lookup=schedule_grid,
             today=today.strftime('%Y-%m-%d'),
             requestable_titles=requestable,
-            shift_hours=get_shift_hours(),
-            config=cfg
+            shift_hours=shift,
         )
 
+    @app.route("/")
+    def dashboard():
+        if data_revision:
+            key = (data_revision(), now_utc().date())  # read before building: a commit mid-build misses next time
+            cached = _dashboard_cache[0]
+            if cached and cached[0] == key and time.monotonic() - cached[1] < DASHBOARD_CACHE_TTL:
+                ctx = cached[2]
+            else:
+                ctx = _dashboard_context()
+                _dashboard_cache[0] = (key, time.monotonic(), ctx)  # one slot, swapped whole
+        else:
+            ctx = _dashboard_context()
+        return render_template('dashboard.html', config=state.get('config', {}), **ctx)
+
     @app.route("/log")
     def view_log():
         csv_path = os.path.join(os.path.dirname(__file__), "data", "requests.csv")
@@ -276,7 +181,7 @@ def register_routes(app, deps):
 
         # Ensure time matches current slot grid
         _shift = int(get_shift_hours())
-        _allowed = set(compute_slots(_shift))
+        _allowed = allowed_slots(_shift)
         if time_str not in _allowed:
             flash(f"Time must be one of {sorted(_allowed)} UTC.")
             return redirect(url_for("dashboard"))